@@ -1,20 +1,271 @@
 #!/usr/bin/env python3
 """
 Video to Audio Converter (Python)
-Converts video files to MP3 format using FFmpeg
+Converts video files to MP3 (or AAC with --prefer-aac) using FFmpeg
 """
 
+import argparse
+import asyncio
+import collections
+import functools
+import io
 import os
+import shutil
 import sys
 import subprocess
+import time
 import urllib.parse
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import Callable, Iterator, List, Optional, Dict, Any, Tuple, Union
+
+# Minimum seconds between progress updates on the terminal
+PROGRESS_INTERVAL = 0.25
+
+# Batch mode prints each update on its own line, so report less often per file
+BATCH_PROGRESS_INTERVAL = 5.0
+
+# Input options per URL scheme: give up on a stalled read after 15 s and, for
+# HTTP, reconnect instead of failing the whole download. -rw_timeout is a
+# protocol option; rtsp is a demuxer, which takes -timeout instead.
+NETWORK_TIMEOUT_US = '15000000'
+HTTP_INPUT_ARGS = [
+    '-rw_timeout', NETWORK_TIMEOUT_US,
+    '-reconnect', '1',
+    '-reconnect_streamed', '1',
+    '-reconnect_delay_max', '5',
+    '-user_agent', 'Mozilla/5.0'
+]
+REMOTE_INPUT_ARGS = {
+    'http://': HTTP_INPUT_ARGS,
+    'https://': HTTP_INPUT_ARGS,
+    'ftp://': ['-rw_timeout', NETWORK_TIMEOUT_US],
+    'ftps://': ['-rw_timeout', NETWORK_TIMEOUT_US],
+    'rtmp://': ['-rw_timeout', NETWORK_TIMEOUT_US],
+    'rtsp://': ['-timeout', NETWORK_TIMEOUT_US],
+}
+
+# Input schemes treated as URLs rather than local paths (matched case-insensitively)
+URL_PREFIXES = tuple(REMOTE_INPUT_ARGS)
+URL_PREFIX_LENGTH = max(len(prefix) for prefix in URL_PREFIXES)
+
+FFMPEG_NOT_FOUND = "❌ FFmpeg not found. Please make sure FFmpeg is installed and in your PATH."
+
+# Bytes to megabytes, as a multiplier for the per-file size math
+_INV_MB = 1.0 / (1024 * 1024)
+
+# Audio encoders: the codec they produce and the container they are written to
+AUDIO_ENCODERS = {
+    'libmp3lame': ('mp3', '.mp3'),
+    'aac_at': ('aac', '.m4a'),      # AudioToolbox (macOS)
+    'libfdk_aac': ('aac', '.m4a'),
+}
+DEFAULT_ENCODER = 'libmp3lame'
+
+# Read buffer for the ffmpeg output pipe
+PIPE_BUFFER_SIZE = 1 << 20
+
+# libmp3lame is single-threaded, so run several files side by side instead
+DEFAULT_JOBS = max(1, (os.cpu_count() or 1) // 2)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env_config() -> Dict[str, str]:
+    """Load configuration from the .env file in the parent directory (parsed once)"""
+    config = {}
+    
+    env_path = Path(__file__).parent.parent / '.env'
+    if not env_path.exists():
+        return config
+    
+    try:
+        for line in env_path.read_text().splitlines():
+            line = line.strip()
+            if line and '=' in line:
+                key, value = line.split('=', 1)
+                if key.strip() == 'DEFAULT_DIR':
+                    config['default_dir'] = value.strip()
+    except Exception:
+        pass
+    
+    return config
+
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_path() -> Optional[str]:
+    """Absolute path of the ffmpeg executable, or None if it is not on PATH"""
+    return shutil.which('ffmpeg')
+
+
+@functools.lru_cache(maxsize=None)
+def ffprobe_path() -> Optional[str]:
+    """Absolute path of the ffprobe executable, or None if it is not on PATH"""
+    return shutil.which('ffprobe')
+
+
+@functools.lru_cache(maxsize=None)
+def best_audio_encoder() -> str:
+    """Pick the fastest audio encoder this ffmpeg build offers (probed once)"""
+    try:
+        output = subprocess.check_output(
+            [ffmpeg_path(), '-hide_banner', '-encoders'],
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True
+        )
+    except Exception:
+        return DEFAULT_ENCODER
+    
+    for candidate in ('aac_at', 'libfdk_aac', 'libmp3lame'):
+        if f' {candidate} ' in output:
+            return candidate
+    return DEFAULT_ENCODER
+
+
+def probe_audio_codec(input_path: str) -> Optional[str]:
+    """Return the codec name of the first audio stream, or None if unknown"""
+    exe = ffprobe_path()
+    if exe is None:
+        return None
+    
+    try:
+        output = subprocess.check_output(
+            [
+                exe,
+                '-v', 'error',
+                '-select_streams', 'a:0',
+                '-show_entries', 'stream=codec_name',
+                '-of', 'csv=p=0',
+                input_path
+            ],
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True
+        )
+    except Exception:
+        return None
+    return output.strip() or None
+
+
+def build_ffmpeg_cmd(input_path: str, output_path: str, is_remote: bool = False,
+                     progress: bool = False, quiet: bool = False,
+                     encoder: str = DEFAULT_ENCODER) -> List[str]:
+    """Build the ffmpeg command for an audio conversion (MP3 unless another encoder is given)"""
+    cmd = [ffmpeg_path()]
+    
+    # Audio already in the target codec only needs to be copied out of the container.
+    # Map the probed stream explicitly, as ffmpeg would otherwise pick the audio
+    # stream with the most channels, which may be in another codec.
+    # Remote sources aren't probed: that would open the stream a second time
+    # without the timeout and reconnect options below.
+    if not is_remote and probe_audio_codec(input_path) == AUDIO_ENCODERS[encoder][0]:
+        codec_args = ['-map', '0:a:0', '-c:a', 'copy']
+    else:
+        cmd += ['-threads', '0']  # let the decoder use all cores
+        codec_args = [
+            '-acodec', encoder,
+            '-ab', '192k'  # audio bitrate
+        ]
+    
+    if is_remote:
+        scheme = input_path[:input_path.find('://') + 3].lower()
+        cmd += REMOTE_INPUT_ARGS.get(scheme, [])
+    
+    cmd += ['-i', input_path, '-vn']  # no video
+    cmd += codec_args
+    
+    if progress:
+        # Compact key=value progress records on stdout instead of stats lines
+        cmd += ['-progress', 'pipe:1']
+    if progress or quiet:
+        cmd += ['-nostats', '-loglevel', 'error']
+    
+    cmd += ['-y', output_path]  # overwrite output files
+    return cmd
+
+
+def _is_progress_record(line: str) -> bool:
+    """Check if a line is one of ffmpeg's -progress key=value records"""
+    key, sep, _ = line.partition('=')
+    return bool(sep) and key.replace('_', '').isalnum()
+
+
+async def _convert_async(input_path: str, output_path: str, encoder: str,
+                         sem: asyncio.Semaphore, quiet: bool = False) -> Optional[str]:
+    """Convert one file in a child ffmpeg process, returning an error message or None
+    
+    Unless quiet, throttled progress lines prefixed with the file name are
+    printed, interleaved with those of the other running conversions.
+    """
+    name = os.path.basename(input_path)
+    async with sem:
+        proc = None
+        try:
+            # ffprobe runs synchronously, so keep it off the event loop
+            loop = asyncio.get_running_loop()
+            cmd = await loop.run_in_executor(
+                None, functools.partial(
+                    build_ffmpeg_cmd, input_path, output_path,
+                    progress=not quiet, quiet=quiet, encoder=encoder
+                )
+            )
+            
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT
+            )
+            
+            # Besides progress records only errors are logged; keep the last
+            # one to explain a failure
+            last_line = ''
+            last = 0.0
+            async for raw in proc.stdout:
+                line = raw.decode('utf-8', errors='replace').strip()
+                if not line:
+                    continue
+                if not _is_progress_record(line):
+                    last_line = line
+                elif not quiet and line.startswith('out_time='):
+                    now = time.monotonic()
+                    if now - last >= BATCH_PROGRESS_INTERVAL:
+                        last = now
+                        print(f"⏳ {name}: {line[9:]}")
+            await proc.wait()
+        except Exception as e:
+            error = str(e)
+            # Don't leave a child running with an undrained pipe
+            if proc is not None and proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        else:
+            if proc.returncode == 0:
+                error = None
+            else:
+                error = f"FFmpeg failed with return code: {proc.returncode}"
+                if last_line:
+                    error += f" ({last_line})"
+    
+    if error is None:
+        print(f"✅ {name} → {os.path.basename(output_path)}")
+    else:
+        print(f"❌ {name}: {error}")
+    return error
+
+
+async def run_many(pairs: List[Tuple[str, str]], workers: int,
+                   encoder: str = DEFAULT_ENCODER, quiet: bool = False) -> List[Optional[str]]:
+    """Run up to `workers` ffmpeg conversions concurrently in one event loop"""
+    sem = asyncio.Semaphore(workers)
+    return await asyncio.gather(*[
+        _convert_async(input_path, output_path, encoder, sem, quiet)
+        for input_path, output_path in pairs
+    ])
 
 
 class VideoFile:
     """Represents a video file with metadata"""
     
+    # No per-instance __dict__; large scans create one of these per file
+    __slots__ = ('name', 'path', 'size_mb', 'extension')
+    
     def __init__(self, name: str, path: str, size_mb: float, extension: str):
         self.name = name
         self.path = path
@@ -28,136 +279,240 @@ class VideoFile:
 class VideoConverter:
     """Main video converter class"""
     
-    SUPPORTED_EXTENSIONS = {'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.m4v', '.3gp'}
+    SUPPORTED_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.flv', '.wmv', '.webm', '.m4v', '.3gp'})
     
-    def __init__(self):
-        self.config = self._load_config()
-    
-    def _load_config(self) -> Dict[str, str]:
-        """Load configuration from .env file"""
-        config = {
-            'default_dir': '/Users/hackyourfuture/Downloads'  # fallback default
+    def __init__(self, jobs: int = DEFAULT_JOBS, quiet: bool = False, recursive: bool = False,
+                 prefer_aac: bool = False):
+        self.config = {
+            'default_dir': '/Users/hackyourfuture/Downloads',  # fallback default
+            **_load_env_config()
         }
+        self.jobs = jobs
+        self.quiet = quiet
+        self.recursive = recursive
+        self.encoder = best_audio_encoder() if prefer_aac and ffmpeg_path() else DEFAULT_ENCODER
+        if prefer_aac and ffmpeg_path() and self.encoder == DEFAULT_ENCODER:
+            print("💡 This FFmpeg build has no aac_at or libfdk_aac encoder; converting to MP3")
+        self.output_extension = AUDIO_ENCODERS[self.encoder][1]
+        self._last_total_size: Optional[int] = None  # bytes written, from ffmpeg progress
+    
+    @staticmethod
+    def is_url(string: str) -> bool:
+        """Check if a string is a URL with one of the supported schemes"""
+        # Schemes are case-insensitive; only lowercase the part that is compared
+        return string[:URL_PREFIX_LENGTH].lower().startswith(URL_PREFIXES)
+    
+    def _to_video_file(self, name: str, path: str,
+                       stat: Callable[[], os.stat_result]) -> Optional[VideoFile]:
+        """Build a VideoFile for a supported file, or return None
         
-        # Try to load .env file from parent directory
-        env_path = Path(__file__).parent.parent / '.env'
-        if env_path.exists():
-            try:
-                with open(env_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and '=' in line:
-                            key, value = line.split('=', 1)
-                            if key.strip() == 'DEFAULT_DIR':
-                                config['default_dir'] = value.strip()
-            except Exception:
-                pass
+        `stat` is only called once the extension matches.
+        """
+        # Lowercase once and reuse it for both the lookup and the VideoFile
+        extension = os.path.splitext(name)[1].lower()
+        if extension not in self.SUPPORTED_EXTENSIONS:
+            return None
         
-        return config
+        return VideoFile(
+            name=name,
+            path=path,
+            size_mb=stat().st_size * _INV_MB,
+            extension=extension
+        )
     
     @staticmethod
-    def is_url(string: str) -> bool:
-        """Check if a string is a valid URL"""
-        try:
-            result = urllib.parse.urlparse(string)
-            return all([result.scheme, result.netloc])
-        except Exception:
-            return False
+    def _report_scan_error(error: OSError):
+        """Report a directory that couldn't be read"""
+        print(f"❌ Error reading directory: {error}")
+    
+    def iter_videos(self, root: str) -> Iterator[VideoFile]:
+        """Walk a directory tree for supported video files, skipping hidden directories
+        
+        Names are relative to root so files in different subdirectories stay distinct.
+        """
+        for dirpath, dirnames, filenames in os.walk(root, onerror=self._report_scan_error):
+            # Prune in place so os.walk never descends into hidden directories
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            
+            rel_dir = os.path.relpath(dirpath, root)
+            for name in filenames:
+                path = os.path.join(dirpath, name)
+                rel_name = name if rel_dir == '.' else os.path.join(rel_dir, name)
+                try:
+                    video_file = self._to_video_file(rel_name, path, lambda: os.stat(path))
+                except OSError:
+                    continue  # e.g. a broken symlink
+                
+                if video_file is not None:
+                    yield video_file
     
     def get_video_files(self, directory: str) -> List[VideoFile]:
-        """Scan directory for supported video files"""
+        """Scan directory (or the whole tree in recursive mode) for supported video files"""
         video_files = []
         
         try:
-            directory_path = Path(directory)
-            if not directory_path.exists():
+            if not os.path.isdir(directory):
                 return []
             
-            for file_path in directory_path.iterdir():
-                if file_path.is_file() and file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                    size_mb = file_path.stat().st_size / (1024 * 1024)
+            if self.recursive:
+                video_files = list(self.iter_videos(directory))
+                video_files.sort(key=lambda x: x.name.lower())
+                return video_files
+            
+            # DirEntry caches the file type and stat result from the directory read
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
                     
-                    video_files.append(VideoFile(
-                        name=file_path.name,
-                        path=str(file_path),
-                        size_mb=size_mb,
-                        extension=file_path.suffix.lower()
-                    ))
+                    video_file = self._to_video_file(entry.name, entry.path, entry.stat)
+                    if video_file is not None:
+                        video_files.append(video_file)
             
             # Sort files alphabetically
             video_files.sort(key=lambda x: x.name.lower())
             
         except Exception as e:
-            print(f"❌ Error reading directory: {e}")
+            self._report_scan_error(e)
             return []
         
         return video_files
     
-    def get_output_path(self, input_path: str) -> str:
-        """Generate output MP3 path based on input path"""
-        if self.is_url(input_path):
-            parsed_url = urllib.parse.urlparse(input_path)
-            base_name = Path(parsed_url.path).stem or 'output'
-            return f"{base_name}.mp3"
+    def get_output_path(self, input_path: str, is_remote: Optional[bool] = None) -> str:
+        """Generate output audio path (MP3 by default) based on input path"""
+        if is_remote is None:
+            is_remote = self.is_url(input_path)
+        
+        if is_remote:
+            url_path = urllib.parse.urlparse(input_path).path
+            base_name = os.path.splitext(os.path.basename(url_path))[0] or 'output'
+            return base_name + self.output_extension
+        
+        root, _ = os.path.splitext(input_path)
+        return root + self.output_extension
+    
+    def get_batch_pairs(self, input_paths: List[str]) -> List[Tuple[str, str]]:
+        """Pair local input files with output paths that don't collide
+        
+        Inputs that would share an output (clip.mp4 and clip.mkv) keep their
+        extension in the output name instead: clip.mp4.mp3 and clip.mkv.mp3.
+        """
+        output_paths = [self.get_output_path(path, is_remote=False) for path in input_paths]
+        # Compare case-insensitively so case-insensitive filesystems are covered too
+        counts = collections.Counter(path.lower() for path in output_paths)
         
-        input_path_obj = Path(input_path)
-        return str(input_path_obj.with_suffix('.mp3'))
+        return [
+            (input_path, output_path if counts[output_path.lower()] == 1
+             else input_path + self.output_extension)
+            for input_path, output_path in zip(input_paths, output_paths)
+        ]
     
-    def convert_to_mp3(self, input_path: str, output_path: str) -> bool:
-        """Convert video to MP3 using ffmpeg"""
-        print(f"🔄 Converting: {Path(input_path).name} → {Path(output_path).name}")
+    def convert_to_audio(self, input_path: str, output_path: str, *, is_remote: bool = False) -> bool:
+        """Convert video to audio using ffmpeg, in the format of self.encoder (MP3 by default)"""
+        print(f"🔄 Converting: {os.path.basename(input_path)} → {os.path.basename(output_path)}")
+        
+        if ffmpeg_path() is None:
+            print(FFMPEG_NOT_FOUND)
+            return False
+        
+        self._last_total_size = None
         
         try:
-            # Build ffmpeg command
-            cmd = [
-                'ffmpeg',
-                '-i', input_path,
-                '-vn',  # no video
-                '-acodec', 'libmp3lame',
-                '-ab', '192k',  # audio bitrate
-                '-y',  # overwrite output files
-                output_path
-            ]
-            
-            print("🎬 FFmpeg started...")
-            
-            # Run ffmpeg command with live output
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True
-            )
-            
-            # Print ffmpeg progress
-            for line in process.stdout:
-                if 'time=' in line and 'bitrate=' in line:
-                    # Extract and show progress
-                    parts = line.strip().split()
-                    time_part = next((part for part in parts if part.startswith('time=')), '')
-                    if time_part:
-                        print(f"\r⏳ Progress: {time_part.replace('time=', '')}", end='', flush=True)
-            
-            process.wait()
-            print()  # New line after progress
+            if self.quiet:
+                # No progress UI: let ffmpeg skip stats and only collect its errors
+                cmd = build_ffmpeg_cmd(input_path, output_path, is_remote, quiet=True,
+                                       encoder=self.encoder)
+                result = subprocess.run(
+                    cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    universal_newlines=True,
+                    errors='replace'
+                )
+                returncode = result.returncode
+                error_lines = result.stderr.strip().splitlines()
+                last_error = error_lines[-1].strip() if error_lines else ''
+            else:
+                cmd = build_ffmpeg_cmd(input_path, output_path, is_remote, progress=True,
+                                       encoder=self.encoder)
+                print("🎬 FFmpeg started...")
+                returncode, last_error = self._run_with_progress(cmd)
             
-            if process.returncode == 0:
+            if returncode == 0:
                 return True
             else:
-                print(f"❌ FFmpeg failed with return code: {process.returncode}")
+                message = f"❌ FFmpeg failed with return code: {returncode}"
+                if last_error:
+                    message += f" ({last_error})"
+                print(message)
                 return False
             
-        except FileNotFoundError:
-            print("❌ FFmpeg not found. Please make sure FFmpeg is installed and in your PATH.")
-            return False
         except Exception as e:
             print(f"❌ Error during conversion: {e}")
             return False
     
+    def _run_with_progress(self, cmd: List[str]) -> Tuple[int, str]:
+        """Run ffmpeg with live progress output
+        
+        Returns the exit code and the last error line ffmpeg logged, if any.
+        """
+        process = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=PIPE_BUFFER_SIZE
+        )
+        reader = io.TextIOWrapper(process.stdout, encoding='utf-8', errors='replace', newline='\n')
+        
+        # Print ffmpeg progress, throttled to a few updates per second
+        last = 0.0
+        latest = shown = last_error = ''
+        for raw in reader:
+            if raw.startswith('total_size='):
+                # Remember the output size so it doesn't need a stat afterwards
+                value = raw[11:-1]
+                if value.isdigit():
+                    self._last_total_size = int(value)
+            elif raw.startswith('out_time='):
+                latest = raw[9:-1]
+                now = time.monotonic()
+                if now - last < PROGRESS_INTERVAL:
+                    continue
+                last = now
+                shown = latest
+                sys.stdout.write('\r⏳ Progress: ' + shown)
+                sys.stdout.flush()
+            elif raw.startswith('progress=end') and latest != shown:
+                # Always show the final position, even if it fell inside the throttle window
+                shown = latest
+                sys.stdout.write('\r⏳ Progress: ' + shown)
+                sys.stdout.flush()
+            elif not _is_progress_record(raw):
+                # Errors share the pipe; keep the last one to explain a failure
+                line = raw.strip()
+                if line:
+                    last_error = line
+        
+        process.wait()
+        print()  # New line after progress
+        return process.returncode, last_error
+    
+    def convert_many(self, pairs: List[Tuple[str, str]], workers: int) -> int:
+        """Convert several files in parallel, returning the number of failures"""
+        if ffmpeg_path() is None:
+            print(FFMPEG_NOT_FOUND)
+            return len(pairs)
+        
+        workers = max(1, min(workers, len(pairs)))
+        print(f"🔄 Converting {len(pairs)} file(s) using {workers} worker(s)...")
+        
+        errors = asyncio.run(run_many(pairs, workers, self.encoder, self.quiet))
+        return sum(error is not None for error in errors)
+    
     def get_file_size_mb(self, file_path: str) -> Optional[float]:
         """Get file size in MB"""
         try:
-            return Path(file_path).stat().st_size / (1024 * 1024)
+            return Path(file_path).stat().st_size * _INV_MB
         except Exception:
             return None
     
@@ -184,13 +539,17 @@ class VideoConverter:
         # Ask for custom directory
         while True:
             custom_dir = input("Enter root directory path: ").strip()
-            if Path(custom_dir).exists():
+            if custom_dir and os.path.isdir(custom_dir):
                 return custom_dir
             else:
                 print(f"❌ Directory not found: {custom_dir}")
     
-    def select_video_file(self, video_files: List[VideoFile], root_dir: str) -> str:
-        """Let user select a video file or enter manual input"""
+    def select_video_file(self, video_files: List[VideoFile], root_dir: str) -> Union[str, List[str]]:
+        """Let user select a video file, all files, or enter manual input
+        
+        Returns a single file name/path/URL, or a list of paths when all
+        files are selected.
+        """
         if not video_files:
             print("❌ No supported video files found in the directory.")
             print("💡 Supported formats: mp4, avi, mov, mkv, flv, wmv, webm, m4v, 3gp")
@@ -208,20 +567,22 @@ class VideoConverter:
         print(f"📹 Found {len(video_files)} video file(s)")
         print("\nSelect a video file to convert:")
         
-        # Show numbered list
-        for i, video_file in enumerate(video_files, 1):
-            print(f"  {i:2d}. {video_file}")
-        
-        print(f"  {len(video_files) + 1:2d}. 📝 Enter file path or URL manually")
+        # Show numbered list, built up front and written in one go
+        lines = [f"  {i:2d}. {video_file}" for i, video_file in enumerate(video_files, 1)]
+        lines.append(f"  {len(video_files) + 1:2d}. 🎞️  Convert all files")
+        lines.append(f"  {len(video_files) + 2:2d}. 📝 Enter file path or URL manually")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         while True:
             try:
-                choice = input(f"\nEnter choice (1-{len(video_files) + 1}): ").strip()
+                choice = input(f"\nEnter choice (1-{len(video_files) + 2}): ").strip()
                 choice_num = int(choice)
                 
                 if 1 <= choice_num <= len(video_files):
                     return video_files[choice_num - 1].name
                 elif choice_num == len(video_files) + 1:
+                    return [video_file.path for video_file in video_files]
+                elif choice_num == len(video_files) + 2:
                     # Manual input
                     while True:
                         file_input = input("Enter video file path or URL: ").strip()
@@ -229,7 +590,7 @@ class VideoConverter:
                             return file_input
                         print("Please enter a file path or URL")
                 else:
-                    print(f"Please enter a number between 1 and {len(video_files) + 1}")
+                    print(f"Please enter a number between 1 and {len(video_files) + 2}")
             
             except ValueError:
                 print("Please enter a valid number")
@@ -253,30 +614,46 @@ class VideoConverter:
             # Let user select file
             selected_file = self.select_video_file(video_files, root_dir)
             
-            # Determine full input path
-            if self.is_url(selected_file) or Path(selected_file).is_absolute():
+            # Convert every file in the directory
+            if isinstance(selected_file, list):
+                pairs = self.get_batch_pairs(selected_file)
+                print()
+                failures = self.convert_many(pairs, self.jobs)
+                if failures:
+                    print(f"❌ {failures} of {len(pairs)} conversion(s) failed!")
+                    sys.exit(1)
+                print(f"✅ All {len(pairs)} conversion(s) finished")
+                return
+            
+            # Classify the input once and determine the full input path
+            is_remote = self.is_url(selected_file)
+            if is_remote or os.path.isabs(selected_file):
                 full_input_path = selected_file
             else:
-                full_input_path = str(Path(root_dir) / selected_file)
+                full_input_path = os.path.join(root_dir, selected_file)
             
             # Check if local file exists
-            if not self.is_url(full_input_path) and not Path(full_input_path).exists():
+            if not is_remote and not os.path.exists(full_input_path):
                 print(f"❌ File not found: {full_input_path}")
                 return
             
             # Generate output path
-            output_path = self.get_output_path(full_input_path)
+            output_path = self.get_output_path(full_input_path, is_remote)
             
             print(f"\n📁 Input: {full_input_path}")
             print(f"💾 Output: {output_path}")
             print()
             
             # Perform conversion
-            if self.convert_to_mp3(full_input_path, output_path):
+            if self.convert_to_audio(full_input_path, output_path, is_remote=is_remote):
                 print(f"✅ Conversion finished: {output_path}")
                 
-                # Show output file size
-                if size_mb := self.get_file_size_mb(output_path):
+                # Show output file size, as reported by ffmpeg when available
+                if self._last_total_size is not None:
+                    size_mb = self._last_total_size * _INV_MB
+                else:
+                    size_mb = self.get_file_size_mb(output_path)
+                if size_mb:
                     print(f"📊 Output file size: {size_mb:.2f} MB")
             else:
                 print("❌ Conversion failed!")
@@ -287,10 +664,42 @@ class VideoConverter:
             sys.exit(0)
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Convert video files to audio (MP3 by default) using FFmpeg")
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"number of parallel conversions when converting all files (default: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        '-r', '--recursive',
+        action='store_true',
+        help="also look for videos in subdirectories (hidden ones are skipped)"
+    )
+    parser.add_argument(
+        '--prefer-aac',
+        action='store_true',
+        help="encode to AAC (.m4a) with aac_at or libfdk_aac when FFmpeg has one; falls back to MP3"
+    )
+    parser.add_argument(
+        '-q', '--quiet',
+        action='store_true',
+        help="don't show FFmpeg progress while converting"
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    return args
+
+
 def main():
     """Entry point"""
+    args = parse_args()
     try:
-        converter = VideoConverter()
+        converter = VideoConverter(jobs=args.jobs, quiet=args.quiet, recursive=args.recursive,
+                                   prefer_aac=args.prefer_aac)
         converter.run()
     except KeyboardInterrupt:
         print("\n👋 Goodbye!")